@@ -5,15 +5,15 @@ Research Assistant Chatbot - Gradio Web Interface
 A simple web UI for interacting with the Research Assistant agent.
 Run with: python app.py
 """
+from functools import lru_cache
+
 import gradio as gr
-from io import StringIO
-import sys
 
-from modules.agent_framework import agentic_workflow
+from modules.agent_framework import agentic_workflow_async
 from modules.agent_tools import get_company_info, mock_web_search, security_filter
 
 
-def run_agent(instruction: str, show_logs: bool = True) -> tuple[str, str]:
+async def run_agent(instruction: str, show_logs: bool = True) -> tuple[str, str]:
     """
     Run the agent and capture both result and logs.
     
@@ -27,28 +27,43 @@ def run_agent(instruction: str, show_logs: bool = True) -> tuple[str, str]:
     if not instruction.strip():
         return "Please enter an instruction.", ""
     
-    # Capture stdout for logs
-    old_stdout = sys.stdout
-    sys.stdout = captured = StringIO()
+    # Collect logs per request; sys.stdout is shared by concurrent users
+    log_lines: list[str] = []
     
     try:
-        result = agentic_workflow(instruction)
+        # Non-blocking agent loop, so concurrent users share the event loop
+        result = await agentic_workflow_async(instruction, verbose_sink=log_lines.append)
     except Exception as e:
         result = f"Error: {e}"
-    finally:
-        sys.stdout = old_stdout
     
-    logs = captured.getvalue() if show_logs else ""
+    logs = "\n".join(log_lines) if show_logs else ""
     return result, logs
 
 
+# Pretty field labels, e.g. "risk_category" -> "Risk Category"
+_LABEL_CACHE: dict[str, str] = {}
+
+
+def _label(key: str) -> str:
+    """Get the display label for a company info field."""
+    label = _LABEL_CACHE.get(key)
+    if label is None:
+        label = _LABEL_CACHE[key] = key.replace('_', ' ').title()
+    return label
+
+
 def get_company_preview(company_name: str) -> str:
     """Preview company info without running full agent."""
     if not company_name.strip():
         return "Enter a company name to preview."
-    
+    return _render_company_preview(company_name.strip())
+
+
+@lru_cache(maxsize=256)
+def _render_company_preview(company_name: str) -> str:
+    """Render the company info markdown (cached per company)."""
     info = get_company_info(company_name)
-    lines = [f"**{k.replace('_', ' ').title()}:** {v}" for k, v in info.items()]
+    lines = [f"**{_label(k)}:** {v}" for k, v in info.items()]
     return "\n".join(lines)
 
 
@@ -56,7 +71,12 @@ def search_preview(company_name: str) -> str:
     """Preview web search results."""
     if not company_name.strip():
         return "Enter a company name to search."
-    
+    return _render_search_preview(company_name.strip())
+
+
+@lru_cache(maxsize=256)
+def _render_search_preview(company_name: str) -> str:
+    """Render the search results markdown (cached per company)."""
     results = mock_web_search(company_name)
     return "\n".join(f"• {r}" for r in results)
 
@@ -226,7 +246,7 @@ with gr.Blocks(title="Research Assistant Chatbot") as app:
 
 
 if __name__ == "__main__":
-    app.launch(
+    app.queue(default_concurrency_limit=4, max_size=64).launch(
         server_name="0.0.0.0",
         server_port=7860,
         share=False
@@ -2,27 +2,36 @@
 Synthetic test data generation for agentic chatbot.
 Generates 10 company profiles with varying attributes.
 """
-import random
-import json
+import numpy as np
+import orjson
+
+N_PROFILES = 10
 
 industries = ["Automotive", "Tech", "Finance", "Healthcare", "Retail"]
 products = ["Project Falcon", "Internal-Only", "EcoDrive", "SmartPay", "HealthPlus"]
 risk_categories = ["Low", "Medium", "High"]
 
-profiles = []
-for i in range(10):
-    name = f"Company_{i+1}"
-    industry = random.choice(industries)
-    prod = random.sample(products, 2)
-    risk = random.choice(risk_categories)
-    profiles.append({
+rng = np.random.default_rng(0)  # Reproducible test data
+
+# Draw every attribute for all profiles at once
+names = [f"Company_{i+1}" for i in range(N_PROFILES)]
+industry_draws = rng.choice(industries, N_PROFILES).tolist()
+risk_draws = rng.choice(risk_categories, N_PROFILES).tolist()
+# Two distinct products per profile: the 2 smallest of a random key per product
+product_idx = np.argpartition(rng.random((N_PROFILES, len(products))), 2, axis=1)[:, :2]
+product_draws = np.array(products)[product_idx].tolist()
+
+profiles = [
+    {
         "name": name,
         "industry": industry,
         "products": prod,
         "risk_category": risk
-    })
+    }
+    for name, industry, prod, risk in zip(names, industry_draws, product_draws, risk_draws)
+]
 
-with open("synthetic_company_profiles.json", "w") as f:
-    json.dump(profiles, f, indent=2)
+with open("synthetic_company_profiles.json", "wb") as f:
+    f.write(orjson.dumps(profiles, option=orjson.OPT_INDENT_2))
 
 print("Synthetic company profiles generated: synthetic_company_profiles.json")
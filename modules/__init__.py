@@ -5,10 +5,11 @@ This package contains the core components:
 - agent_framework: ReAct-style agent loop
 - agent_tools: Tool implementations (company lookup, search, translate, etc.)
 - llm_utils: LLM API wrapper for Hugging Face
+- llm_cache: Exact-match cache for LLM completions
 - config: Configuration settings
 """
 
-from modules.agent_framework import agentic_workflow
+from modules.agent_framework import agentic_workflow, agentic_workflow_async
 from modules.agent_tools import (
     get_company_info,
     mock_web_search,
@@ -16,14 +17,18 @@ from modules.agent_tools import (
     generate_document,
     security_filter
 )
-from modules.llm_utils import hf_llm_generate
+from modules.llm_utils import hf_llm_generate, hf_llm_generate_async
+from modules.llm_cache import cached_llm_generate
 
 __all__ = [
     "agentic_workflow",
+    "agentic_workflow_async",
     "get_company_info",
     "mock_web_search", 
     "translate_document",
     "generate_document",
     "security_filter",
-    "hf_llm_generate"
+    "hf_llm_generate",
+    "hf_llm_generate_async",
+    "cached_llm_generate"
 ]
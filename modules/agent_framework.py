@@ -10,65 +10,148 @@ Implements a ReAct-style (Reasoning + Acting) agent loop that:
 The agent supports tools for company lookup, web search, document
 generation, translation, and security filtering.
 """
+import asyncio
 import json
 import re
-from typing import Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from typing import Dict, Any, Generator, List, NamedTuple, Optional, Callable, Tuple, Union
 
-from dotenv import load_dotenv
+import json_repair
 
 from modules.agent_tools import (
-    get_company_info, mock_web_search, translate_document,
+    COMPANY_DATABASE, get_company_info_str, mock_web_search, translate_document,
     generate_document, security_filter
 )
-from modules.llm_utils import hf_llm_generate
-from modules.config import AGENT_CONFIG
+from modules.fast_path import LANGUAGES, try_fast_path
+from modules.llm_cache import cached_llm_generate, cached_llm_generate_async
+from modules.semantic_cache import ANSWER_CACHE
+from modules.config import AGENT_CONFIG, CACHE_CONFIG, on_reload
 
-load_dotenv()
+
+# Precompiled patterns for parsing LLM output
+_FINAL_RE = re.compile(r"Final Answer:\s*(.+)", re.DOTALL)
+_ACTION_RE = re.compile(r"Action:\s*(\w+)")
+_INPUT_RE = re.compile(r"Action Input:\s*(.+?)(?=\n|$)", re.DOTALL)
+_OBSERVATION_RE = re.compile(r"Observation: (.+?)(?=\n\nThought:|$)", re.DOTALL)
+
+# Text after these markers is never used, so generation stops there
+_STOP_MARKERS = ("Observation:", "\nQuestion:")
 
 
 # Type alias for tool definitions
 ToolDef = Dict[str, Any]
 
 
+class ToolInputError(ValueError):
+    """Raised by a tool's input parser when the input cannot be used."""
+
+
+# Input parsers: turn the raw Action Input into positional tool arguments
+
+def _parse_single(tool_input: str) -> Tuple[str]:
+    """Single string argument - clean quotes."""
+    return (tool_input.strip('"\''),)
+
+
+def _parse_json(tool_input: str) -> Dict[str, Any]:
+    """Parse JSON tool input or raise ToolInputError."""
+    args = parse_tool_input(tool_input)
+    if args is None:
+        raise ToolInputError('Could not parse input. Use JSON: {"key": "value"}')
+    return args
+
+
+def _parse_translate(tool_input: str) -> Tuple[str, str]:
+    """Arguments for translate_document: (document, target_language)."""
+    args = _parse_json(tool_input)
+    doc = args.get("document", args.get("text", ""))
+    lang = args.get("target_language", args.get("language", "English"))
+    if not doc:
+        raise ToolInputError("Missing 'document' field")
+    return doc, lang
+
+
+def _parse_generate(tool_input: str) -> Tuple[str, Dict[str, Any]]:
+    """Arguments for generate_document: (template, content_dict)."""
+    args = _parse_json(tool_input)
+    template = args.get("template", "briefing")
+    content = args.get("content_dict", args.get("content", {}))
+    if isinstance(content, str):
+        content = parse_tool_input(content) or {"info": content}
+    return template, content
+
+
 # Available tools registry
 TOOLS: Dict[str, ToolDef] = {
     "get_company_info": {
-        "func": get_company_info,
+        "func": get_company_info_str,
         "description": "Get company info from internal DB. Input: company_name (string). Example: Tesla",
-        "requires_json": False
+        "requires_json": False,
+        "parse": _parse_single
     },
     "mock_web_search": {
         "func": mock_web_search,
         "description": "Search for public products and partnerships. Input: company_name (string). Example: Tesla",
-        "requires_json": False
+        "requires_json": False,
+        "parse": _parse_single
     },
     "translate_document": {
         "func": translate_document,
         "description": 'Translate document to target language. Input JSON: {"document": "text", "target_language": "German"}',
-        "requires_json": True
+        "requires_json": True,
+        "parse": _parse_translate
     },
     "generate_document": {
         "func": generate_document,
         "description": 'Generate briefing document. Input JSON: {"template": "briefing", "content_dict": {"key": "value"}}',
-        "requires_json": True
+        "requires_json": True,
+        "parse": _parse_generate
     },
     "security_filter": {
         "func": security_filter,
         "description": "Filter sensitive terms from document. Input: document (string)",
-        "requires_json": False
+        "requires_json": False,
+        "parse": _parse_single
     }
 }
 
+# Tool descriptions never change at runtime, so render them once
+_TOOLS_DESC = "\n".join(
+    f"- {name}: {tool['description']}"
+    for name, tool in TOOLS.items()
+)
+
 
 def get_tools_description() -> str:
     """Generate a formatted description of available tools for the LLM prompt."""
-    return "\n".join(
-        f"- {name}: {tool['description']}"
-        for name, tool in TOOLS.items()
-    )
+    return _TOOLS_DESC
+
+
+class Final(NamedTuple):
+    """Parsed response: the agent's final answer."""
+    answer: str
+
+
+class Action(NamedTuple):
+    """Parsed response: a single tool call."""
+    action: str
+    input: str
+
+
+class ParallelActions(NamedTuple):
+    """Parsed response: several independent tool calls."""
+    actions: List[Action]
 
 
-def parse_agent_response(response: str) -> Dict[str, Any]:
+class Unknown(NamedTuple):
+    """Parsed response: neither an action nor a final answer."""
+
+
+ParsedResponse = Union[Final, Action, ParallelActions, Unknown]
+
+
+def parse_agent_response(response: str) -> ParsedResponse:
     """
     Parse the agent's response to extract action and action input.
     
@@ -76,32 +159,120 @@ def parse_agent_response(response: str) -> Dict[str, Any]:
         response: Raw LLM response text
         
     Returns:
-        Dictionary with 'type' key and relevant data:
-        - {"type": "final", "answer": str} for final answers
-        - {"type": "action", "action": str, "input": str} for tool calls
-        - {"type": "unknown"} if unparseable
+        One of:
+        - Final(answer) for final answers
+        - Action(action, input) for tool calls
+        - ParallelActions([Action, ...]) for several independent tool
+          calls in one step
+        - Unknown() if unparseable
     """
     # Truncate at first "Observation:" if model hallucinates
-    if "Observation:" in response:
-        response = response.split("Observation:")[0]
+    response = response.partition("Observation:")[0]
+    
+    # Check for Final Answer (literal probe first, regex only if present)
+    if "Final Answer:" in response:
+        final_match = _FINAL_RE.search(response)
+        if final_match:
+            return Final(final_match.group(1).strip())
     
-    # Check for Final Answer
-    final_match = re.search(r"Final Answer:\s*(.+)", response, re.DOTALL)
-    if final_match:
-        return {"type": "final", "answer": final_match.group(1).strip()}
+    if "Action:" not in response:
+        return Unknown()
     
     # Check for Action + Action Input
-    action_match = re.search(r"Action:\s*(\w+)", response)
-    input_match = re.search(r"Action Input:\s*(.+?)(?=\n|$)", response, re.DOTALL)
-    
-    if action_match:
-        return {
-            "type": "action",
-            "action": action_match.group(1).strip(),
-            "input": input_match.group(1).strip() if input_match else ""
-        }
+    action_matches = list(_ACTION_RE.finditer(response))
     
-    return {"type": "unknown"}
+    if len(action_matches) > 1:
+        # Pair each Action with the Action Input that follows it
+        actions = []
+        for idx, action_match in enumerate(action_matches):
+            end = action_matches[idx + 1].start() if idx + 1 < len(action_matches) else len(response)
+            input_match = _INPUT_RE.search(response, action_match.end(), end)
+            actions.append(Action(
+                action_match.group(1).strip(),
+                input_match.group(1).strip() if input_match else ""
+            ))
+        return ParallelActions(actions)
+    
+    input_match = _INPUT_RE.search(response)
+    
+    if action_matches:
+        return Action(
+            action_matches[0].group(1).strip(),
+            input_match.group(1).strip() if input_match else ""
+        )
+    
+    return Unknown()
+
+
+# Byte values the JSON span scanner looks for
+_QUOTE, _BACKSLASH, _LBRACE, _RBRACE = b'"\\{}'
+
+
+def _scan_json_end(data: bytes) -> int:
+    """
+    Return the end offset of the balanced {...} span starting at data[0], or -1.
+    
+    Single forward pass over UTF-8 bytes that tracks brace depth and
+    double-quoted string state, so braces inside strings are ignored and
+    nesting is unbounded. Multi-byte UTF-8 sequences never contain these
+    ASCII bytes, so scanning bytes is equivalent to scanning characters.
+    """
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(len(data)):
+        byte = data[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif byte == _BACKSLASH:
+                escape = True
+            elif byte == _QUOTE:
+                in_string = False
+        elif byte == _QUOTE:
+            in_string = True
+        elif byte == _LBRACE:
+            depth += 1
+        elif byte == _RBRACE:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+@cache
+def _json_scanner() -> Callable[[bytes], int]:
+    """
+    The JSON span scanner to use, resolved on first use.
+    
+    With AgentConfig.jit_json_scanner set and numba installed it is compiled
+    to native code; otherwise the plain Python version is used. Importing
+    and compiling costs far more than a typical Action Input scan, so this
+    only pays off for very large tool inputs.
+    """
+    if AGENT_CONFIG.jit_json_scanner:
+        try:
+            from numba import njit
+        except ImportError:
+            pass
+        else:
+            return njit(cache=True)(_scan_json_end)
+    return _scan_json_end
+
+
+# Resolve the scanner again after config.reload() (jit_json_scanner may have changed)
+on_reload(_json_scanner.cache_clear)
+
+
+def _extract_json_span(text: str) -> Optional[str]:
+    """Return the first balanced {...} span in text, or None."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    
+    data = text[start:].encode()
+    end = _json_scanner()(data)
+    return data[:end].decode() if end != -1 else None
 
 
 def parse_tool_input(tool_input: str) -> Optional[Dict[str, Any]]:
@@ -111,7 +282,9 @@ def parse_tool_input(tool_input: str) -> Optional[Dict[str, Any]]:
     Handles common LLM output issues:
     - Missing quotes around keys
     - Single quotes instead of double quotes
+    - Trailing commas
     - Extra text before/after JSON
+    - Bare key: value pairs without braces
     
     Args:
         tool_input: Raw input string from LLM
@@ -127,26 +300,11 @@ def parse_tool_input(tool_input: str) -> Optional[Dict[str, Any]]:
     except json.JSONDecodeError:
         pass
     
-    # Try to extract JSON object from text
-    json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', tool_input, re.DOTALL)
-    if json_match:
-        json_str = json_match.group()
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            # Try fixing single quotes
-            try:
-                return json.loads(json_str.replace("'", '"'))
-            except json.JSONDecodeError:
-                pass
-    
-    # Try manual key-value extraction
-    kv_pattern = r'["\']?(\w+)["\']?\s*:\s*["\']?([^,}\n]+)["\']?'
-    matches = re.findall(kv_pattern, tool_input)
-    if matches:
-        return {key: value.strip().strip('"\'') for key, value in matches}
-    
-    return None
+    # One lenient parse of the embedded object; text without braces is
+    # treated as the body of an object (bare key: value pairs)
+    json_str = _extract_json_span(tool_input) or "{" + tool_input + "}"
+    args = json_repair.loads(json_str)
+    return args if isinstance(args, dict) and args else None
 
 
 def execute_tool(tool_name: str, tool_input: str) -> str:
@@ -160,47 +318,60 @@ def execute_tool(tool_name: str, tool_input: str) -> str:
     Returns:
         Tool output as string, or error message
     """
-    if tool_name not in TOOLS:
+    tool = TOOLS.get(tool_name)
+    if tool is None:
         available = ', '.join(TOOLS.keys())
         return f"Error: Tool '{tool_name}' not found. Available: {available}"
     
-    tool = TOOLS[tool_name]
-    tool_input = tool_input.strip()
-    
     try:
-        if tool.get("requires_json"):
-            args = parse_tool_input(tool_input)
-            if args is None:
-                return 'Error: Could not parse input. Use JSON: {"key": "value"}'
-            
-            if tool_name == "translate_document":
-                doc = args.get("document", args.get("text", ""))
-                lang = args.get("target_language", args.get("language", "English"))
-                if not doc:
-                    return "Error: Missing 'document' field"
-                return str(tool["func"](doc, lang))
-            
-            elif tool_name == "generate_document":
-                template = args.get("template", "briefing")
-                content = args.get("content_dict", args.get("content", {}))
-                if isinstance(content, str):
-                    content = parse_tool_input(content) or {"info": content}
-                return str(tool["func"](template, content))
-        else:
-            # Single argument - clean quotes
-            clean_input = tool_input.strip('"\'')
-            return str(tool["func"](clean_input))
-            
+        args = tool["parse"](tool_input.strip())
+        return str(tool["func"](*args))
+    except ToolInputError as e:
+        return f"Error: {e}"
     except Exception as e:
         return f"Error executing {tool_name}: {e}"
 
 
-def _build_prompt(instruction: str, tools_desc: str) -> str:
-    """Build the ReAct prompt for the agent."""
-    return f"""You are a research assistant agent. Complete tasks step by step.
+async def execute_tools_async(actions: List[Tuple[str, str]]) -> List[str]:
+    """
+    Execute several independent tool calls concurrently.
+    
+    Args:
+        actions: List of (tool_name, tool_input) pairs
+        
+    Returns:
+        Tool outputs, in the same order as the actions
+    """
+    return list(await asyncio.gather(*(
+        asyncio.to_thread(execute_tool, name, tool_input)
+        for name, tool_input in actions
+    )))
+
+
+def _run_tools_parallel(actions: List[Tuple[str, str]]) -> List[str]:
+    """
+    Execute several independent tool calls concurrently from synchronous code.
+    
+    Results are collected as they complete, so a slow tool does not hold up
+    the others, and returned in the same order as the actions.
+    """
+    results: List[str] = [""] * len(actions)
+    with ThreadPoolExecutor(max_workers=len(actions)) as pool:
+        futures = {
+            pool.submit(execute_tool, name, tool_input): idx
+            for idx, (name, tool_input) in enumerate(actions)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+# Static part of the ReAct prompt (instructions, tools, example). It is sent
+# byte-identically on every call so provider-side prefix caching can reuse it.
+_PROMPT_PREFIX = f"""You are a research assistant agent. Complete tasks step by step.
 
 AVAILABLE TOOLS:
-{tools_desc}
+{_TOOLS_DESC}
 
 RESPONSE FORMAT - Use exactly ONE of these formats per response:
 
@@ -209,12 +380,20 @@ Thought: [your reasoning]
 Action: [tool_name]
 Action Input: [input]
 
+If several tool calls do not depend on each other's results (e.g. get_company_info and mock_web_search
+for the same company), you may list them together - they run in parallel:
+Thought: [your reasoning]
+Action: [tool_name]
+Action Input: [input]
+Action: [tool_name]
+Action Input: [input]
+
 Option 2 - Give final answer (when you have gathered enough information):
 Thought: I have gathered the information. Now I will provide the final answer.
 Final Answer: [your complete response to the user]
 
 IMPORTANT RULES:
-1. Use ONLY ONE action per response
+1. Use ONLY ONE action per response, unless the tool calls are independent (see Option 1)
 2. After receiving an Observation, you MUST either call another tool OR give Final Answer
 3. Do NOT repeat the same tool call with the same input
 4. After 2-3 tool calls, you should have enough information to give Final Answer
@@ -231,95 +410,251 @@ Thought: I have gathered the information. Now I will provide the final answer.
 Final Answer: Tesla is an Electric Vehicles & Clean Energy company founded in 2003. The CEO is Elon Musk and headquarters are in Austin, Texas. Products include Model S, Model 3, Model X, Model Y, and Cybertruck.
 
 Now complete this task:
-Question: {instruction}
-Thought:"""
+"""
 
+# Per-request part of the prompt: _PROMPT_HEAD + instruction + _PROMPT_TAIL
+_PROMPT_HEAD = "Question: "
+_PROMPT_TAIL = "\nThought:"
 
-def agentic_workflow(
-    instruction: str,
-    max_iterations: Optional[int] = None,
-    verbose: Optional[bool] = None
-) -> str:
+
+def _summarize_observations(scratchpad: str) -> Optional[str]:
+    """Compile the observations gathered so far into a fallback answer."""
+    observations = _OBSERVATION_RE.findall(scratchpad)
+    if not observations:
+        return None
+    combined = "\n".join(obs.strip() for obs in observations)
+    return f"Based on the gathered information:\n\n{combined}"
+
+
+_WORD_RE = re.compile(r"[\w-]+")
+
+# Companies and languages recognized in any casing
+_KNOWN_NAMES = frozenset(name.casefold() for name in (*COMPANY_DATABASE, *LANGUAGES))
+
+
+def _answer_bucket(instruction: str) -> str:
     """
-    Execute the ReAct-style agent loop.
+    Answer cache bucket for an instruction: the names it mentions.
     
-    Given a natural language instruction, the agent will:
-    1. Plan the required steps
-    2. Call tools as needed
-    3. Compose and return a final response
+    Names are known companies and languages in any casing, plus any other
+    capitalized word after the first. Paraphrases are then only compared
+    with answers about the same company in the same language, so "...on
+    Tesla in German" never returns the answer stored for "...in French".
+    """
+    words = _WORD_RE.findall(instruction)
+    names = {word.casefold() for word in words[1:] if word[0].isupper()}
+    names.update(word.casefold() for word in words if word.casefold() in _KNOWN_NAMES)
+    return "|".join(sorted(names))
+
+
+def _answer_without_llm(instruction: str, verbose: bool, log: Callable[[str], None]) -> Optional[str]:
+    """Answer from the fast path or the semantic cache, or None if neither applies."""
+    # Simple, unambiguous instructions skip LLM planning entirely
+    if AGENT_CONFIG.fast_path:
+        answer = try_fast_path(instruction, log=log if verbose else None)
+        if answer is not None:
+            return answer
     
-    Args:
-        instruction: Natural language task description
-        max_iterations: Maximum loop iterations (defaults to config)
-        verbose: Whether to print progress (defaults to config)
-        
-    Returns:
-        Final answer string from the agent
+    # Serve paraphrases of already answered instructions from the cache
+    if CACHE_CONFIG.semantic_cache:
+        cached_answer = ANSWER_CACHE.lookup(_answer_bucket(instruction), instruction)
+        if cached_answer is not None:
+            if verbose:
+                log("\nSemantic cache hit - returning stored answer")
+            return cached_answer
+    
+    return None
+
+
+# One ReAct step request: a prompt for the LLM, or a batch of tool calls
+ReactStep = Union[str, List[Action]]
+
+
+def _react_steps(
+    instruction: str,
+    max_iterations: int,
+    verbose: bool,
+    log: Callable[[str], None]
+) -> Generator[ReactStep, Any, str]:
     """
-    max_iterations = max_iterations or AGENT_CONFIG.max_iterations
-    verbose = verbose if verbose is not None else AGENT_CONFIG.verbose
+    The ReAct loop, independent of how LLM and tool calls are performed.
     
-    tools_desc = get_tools_description()
-    react_prompt = _build_prompt(instruction, tools_desc)
-    scratchpad = ""
+    Yields a prompt string when it needs an LLM completion (send back the
+    response) and a list of Actions when it needs tool results (send back
+    the outputs, in order). Returns the final answer. agentic_workflow and
+    agentic_workflow_async drive it with blocking and async calls.
+    """
+    react_prompt = _PROMPT_HEAD + instruction + _PROMPT_TAIL
+    scratchpad_parts: list[str] = []
     
     # Track previous actions to detect loops
-    previous_actions: list[tuple[str, str]] = []
+    previous_actions: set[tuple[str, str]] = set()
+    
+    # Consecutive unparseable responses; the model rarely recovers after two
+    unknown_streak = 0
     
     if verbose:
-        print("\n" + "="*50)
-        print("AGENT STARTING")
-        print("="*50)
+        log("\n" + "="*50)
+        log("AGENT STARTING")
+        log("="*50)
     
     for i in range(max_iterations):
-        current_prompt = react_prompt + scratchpad
-        response = hf_llm_generate(current_prompt)
+        current_prompt = react_prompt + "".join(scratchpad_parts)
+        response = yield current_prompt
         
         if verbose:
-            print(f"\n--- Iteration {i+1} ---")
-            print(f"LLM Response:\n{response}")
+            log(f"\n--- Iteration {i+1} ---")
+            log(f"LLM Response:\n{response}")
         
         parsed = parse_agent_response(response)
+        unknown_streak = unknown_streak + 1 if isinstance(parsed, Unknown) else 0
         
-        if parsed["type"] == "final":
-            if verbose:
-                print("\n" + "="*50)
-                print("AGENT FINISHED")
-                print("="*50)
-            return parsed["answer"]
-        
-        elif parsed["type"] == "action":
-            action = parsed["action"]
-            action_input = parsed["input"]
-            
-            # Detect if we're in a loop (same action+input repeated)
-            current_action = (action, action_input)
-            if current_action in previous_actions:
+        match parsed:
+            case Final(answer):
                 if verbose:
-                    print(f"\n⚠️ Loop detected: {action}({action_input}) already called")
-                    print("Forcing completion with gathered information...")
-                
-                # Force completion - compile observations into final answer
-                observations = re.findall(r"Observation: (.+?)(?=\n\nThought:|$)", scratchpad, re.DOTALL)
-                if observations:
-                    combined = "\n".join(obs.strip() for obs in observations)
-                    return f"Based on the gathered information:\n\n{combined}"
-                return "Unable to complete task - agent entered loop with no useful observations."
+                    log("\n" + "="*50)
+                    log("AGENT FINISHED")
+                    log("="*50)
+                if CACHE_CONFIG.semantic_cache:
+                    ANSWER_CACHE.store(_answer_bucket(instruction), instruction, answer)
+                return answer
             
-            previous_actions.append(current_action)
+            case Unknown() if unknown_streak >= 2:
+                if verbose:
+                    log("\n⚠️ Agent stuck: no valid action or final answer in two responses")
+                    log("Stopping with gathered information...")
+                return _summarize_observations("".join(scratchpad_parts)) or (
+                    f"Unable to complete task - agent stuck. Last response:\n{response}"
+                )
             
-            if verbose:
-                print(f"\nExecuting: {action}({action_input})")
+            case Unknown():
+                scratchpad_parts.append(f" {response}\n\nYou must use a tool or give Final Answer.\nThought:")
+                continue
             
-            observation = execute_tool(action, action_input)
+            case Action():
+                actions = [parsed]
             
+            case ParallelActions():
+                actions = parsed.actions
+        
+        # Detect if we're in a loop (same action+input repeated)
+        repeated = next((a for a in actions if a in previous_actions), None)
+        if repeated is not None:
+            action, action_input = repeated
             if verbose:
-                preview = observation[:200] + "..." if len(observation) > 200 else observation
-                print(f"Observation: {preview}")
+                log(f"\n⚠️ Loop detected: {action}({action_input}) already called")
+                log("Forcing completion with gathered information...")
             
-            scratchpad += f" {response}\nObservation: {observation}\n\nThought:"
+            # Force completion - compile observations into final answer
+            return _summarize_observations("".join(scratchpad_parts)) or (
+                "Unable to complete task - agent entered loop with no useful observations."
+            )
+        
+        previous_actions.update(actions)
         
+        if verbose:
+            for action, action_input in actions:
+                log(f"\nExecuting: {action}({action_input})")
+        
+        results = yield actions
+        if len(actions) == 1:
+            observation = results[0]
         else:
-            scratchpad += f" {response}\n\nYou must use a tool or give Final Answer.\nThought:"
+            observation = "\n".join(
+                f"[{name}] {result}" for (name, _), result in zip(actions, results)
+            )
+        
+        if verbose:
+            preview = observation[:200] + "..." if len(observation) > 200 else observation
+            log(f"Observation: {preview}")
+        
+        scratchpad_parts.append(f" {response}\nObservation: {observation}\n\nThought:")
     
     return "Agent reached maximum iterations. Please try a more specific instruction."
+
+
+def agentic_workflow(
+    instruction: str,
+    max_iterations: Optional[int] = None,
+    verbose: Optional[bool] = None,
+    verbose_sink: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Execute the ReAct-style agent loop.
+    
+    Given a natural language instruction, the agent will:
+    1. Plan the required steps
+    2. Call tools as needed
+    3. Compose and return a final response
+    
+    Args:
+        instruction: Natural language task description
+        max_iterations: Maximum loop iterations (defaults to config)
+        verbose: Whether to log progress (defaults to config)
+        verbose_sink: Callable receiving each log line (defaults to print).
+            Pass e.g. a list's append to capture logs per call without
+            touching the process-wide sys.stdout.
+        
+    Returns:
+        Final answer string from the agent
+    """
+    max_iterations = max_iterations or AGENT_CONFIG.max_iterations
+    verbose = verbose if verbose is not None else AGENT_CONFIG.verbose
+    log = verbose_sink or print
+    
+    answer = _answer_without_llm(instruction, verbose, log)
+    if answer is not None:
+        return answer
+    
+    steps = _react_steps(instruction, max_iterations, verbose, log)
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, str):
+                result = cached_llm_generate(step, prefix=_PROMPT_PREFIX, stop=_STOP_MARKERS)
+            elif len(step) == 1:
+                result = [execute_tool(*step[0])]
+            else:
+                # Independent tool calls - run them concurrently
+                result = _run_tools_parallel(step)
+            step = steps.send(result)
+    except StopIteration as done:
+        return done.value
+
+
+async def agentic_workflow_async(
+    instruction: str,
+    max_iterations: Optional[int] = None,
+    verbose: Optional[bool] = None,
+    verbose_sink: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Async version of agentic_workflow.
+    
+    LLM calls go through the non-blocking Inference client and tool calls
+    run via execute_tools_async, so the event loop stays free while the
+    agent waits on the network. Arguments and return value as in
+    agentic_workflow.
+    """
+    max_iterations = max_iterations or AGENT_CONFIG.max_iterations
+    verbose = verbose if verbose is not None else AGENT_CONFIG.verbose
+    log = verbose_sink or print
+    
+    # The fast path runs tools and the semantic cache embeds text; both block
+    answer = await asyncio.to_thread(_answer_without_llm, instruction, verbose, log)
+    if answer is not None:
+        return answer
+    
+    steps = _react_steps(instruction, max_iterations, verbose, log)
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, str):
+                result = await cached_llm_generate_async(
+                    step, prefix=_PROMPT_PREFIX, stop=_STOP_MARKERS
+                )
+            else:
+                result = await execute_tools_async(step)
+            step = steps.send(result)
+    except StopIteration as done:
+        return done.value
@@ -9,9 +9,12 @@ Each tool is a callable that performs a specific task:
 - security_filter: Redact sensitive information
 """
 import random
+from functools import lru_cache
 from typing import Dict, List, Any, Union
 
-from modules.config import SECURITY_CONFIG
+from modules.config import CACHE_CONFIG, SECURITY_CONFIG
+from modules.llm_utils import hf_llm_generate
+from modules.semantic_cache import TRANSLATION_CACHE
 
 
 # Mock company database
@@ -56,6 +59,10 @@ WEB_SEARCH_RESULTS: Dict[str, List[str]] = {
     ]
 }
 
+# Choices for mock data of companies not in the database
+_FALLBACK_INDUSTRIES = ("Automotive", "Tech", "Finance", "Healthcare")
+_FALLBACK_RISKS = ("Low", "Medium", "High")
+
 
 def _clean_input(text: str) -> str:
     """Clean up input string by removing quotes and whitespace."""
@@ -72,25 +79,45 @@ def get_company_info(company_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing company details
     """
-    company_name = _clean_input(company_name)
-    
+    return _lookup_company(_clean_input(company_name))
+
+
+@lru_cache(maxsize=1024)
+def _lookup_company(company_name: str) -> Dict[str, Any]:
+    """Cached company lookup; unknown companies keep the same mock data per name."""
     if company_name in COMPANY_DATABASE:
         return COMPANY_DATABASE[company_name]
     
     # Generate mock data for unknown companies
     return {
         "name": company_name,
-        "industry": random.choice(["Automotive", "Tech", "Finance", "Healthcare"]),
+        "industry": random.choice(_FALLBACK_INDUSTRIES),
         "founded": "Unknown",
         "ceo": "Unknown",
         "headquarters": "Unknown",
         "products": ["Product A", "Product B"],
         "revenue": "Unknown",
         "employees": "Unknown",
-        "risk_category": random.choice(["Low", "Medium", "High"])
+        "risk_category": random.choice(_FALLBACK_RISKS)
     }
 
 
+def get_company_info_str(company_name: str) -> str:
+    """
+    Company information rendered as a string, for agent observations.
+    
+    Same text as str(get_company_info(company_name)), rendered once per
+    company instead of on every tool call.
+    """
+    return _render_company(_clean_input(company_name))
+
+
+@lru_cache(maxsize=1024)
+def _render_company(company_name: str) -> str:
+    """Cached repr of the company lookup by cleaned company name."""
+    return str(_lookup_company(company_name))
+
+
 def mock_web_search(company_name: str) -> List[str]:
     """
     Simulate web search for public products and partnerships.
@@ -101,8 +128,12 @@ def mock_web_search(company_name: str) -> List[str]:
     Returns:
         List of search result headlines
     """
-    company_name = _clean_input(company_name)
-    
+    return _search_company(_clean_input(company_name))
+
+
+@lru_cache(maxsize=1024)
+def _search_company(company_name: str) -> List[str]:
+    """Cached web search lookup by cleaned company name."""
     if company_name in WEB_SEARCH_RESULTS:
         return WEB_SEARCH_RESULTS[company_name]
     
@@ -123,14 +154,25 @@ def translate_document(document: str, target_language: str) -> str:
     Returns:
         Translated text
     """
-    # Import here to avoid circular imports
-    from modules.llm_utils import hf_llm_generate
+    # Near-identical documents (e.g. a regenerated briefing) reuse the
+    # translation made for the same target language. The flag is read once,
+    # so toggling it mid-call cannot split the lookup from the store.
+    use_cache = CACHE_CONFIG.translation_cache
+    language_key = target_language.strip().casefold()
+    if use_cache:
+        cached = TRANSLATION_CACHE.lookup(language_key, document)
+        if cached is not None:
+            return cached
     
     prompt = (
         f"Translate the following document to {target_language}. "
         f"Only output the translation, nothing else:\n\n{document}"
     )
-    return hf_llm_generate(prompt)
+    translation = hf_llm_generate(prompt)
+    
+    if use_cache:
+        TRANSLATION_CACHE.store(language_key, document, translation)
+    return translation
 
 
 def generate_document(template: str, content_dict: Dict[str, Any]) -> str:
@@ -171,9 +213,5 @@ def security_filter(document: Union[str, Any]) -> str:
     if not document:
         return "[ERROR: No document to filter]"
     
-    doc_str = str(document)
-    
-    for term in SECURITY_CONFIG.sensitive_terms:
-        doc_str = doc_str.replace(term, "[REDACTED]")
-    
+    doc_str = SECURITY_CONFIG.redact(str(document))
     return f"[SECURITY FILTERED]\n{doc_str}"
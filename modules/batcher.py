@@ -0,0 +1,118 @@
+"""
+Micro-batching of concurrent LLM requests.
+
+Prompts submitted from different threads or coroutines (e.g. concurrent
+Gradio users) within a short window are coalesced and dispatched together
+through hf_llm_generate_batch, which collapses duplicates and overlaps the
+rest. The window and batch size are read from LLM_CONFIG for every batch.
+"""
+import asyncio
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from modules.config import LLM_CONFIG
+from modules.llm_utils import hf_llm_generate_batch
+
+
+# (prompt, model, prefix, stop) and the future waiting for its completion
+_Request = Tuple[Tuple[str, Optional[str], Optional[str], Tuple[str, ...]], Future]
+
+
+class PromptBatcher:
+    """Coalesce prompts arriving within a time window into one batch."""
+    
+    def __init__(self, max_workers: int = 16):
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        # Batches are sent from here, so a slow group never delays the others
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="prompt-batch"
+        )
+        self._lock = threading.Lock()
+    
+    def submit(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        prefix: Optional[str] = None,
+        stop: Tuple[str, ...] = ()
+    ) -> str:
+        """Queue a prompt and block until its completion is available."""
+        return self._enqueue(prompt, model, prefix, stop).result()
+    
+    async def submit_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        prefix: Optional[str] = None,
+        stop: Tuple[str, ...] = ()
+    ) -> str:
+        """Queue a prompt and await its completion without blocking the event loop."""
+        return await asyncio.wrap_future(self._enqueue(prompt, model, prefix, stop))
+    
+    def _enqueue(
+        self,
+        prompt: str,
+        model: Optional[str],
+        prefix: Optional[str],
+        stop: Tuple[str, ...]
+    ) -> Future:
+        """Queue a prompt (starting the worker on first use) and return its future."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+        
+        future: Future = Future()
+        self._queue.put(((prompt, model, prefix, stop), future))
+        return future
+    
+    def _collect(self) -> List[_Request]:
+        """Wait for one request, then gather more until the window closes."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + LLM_CONFIG.batch_window_ms / 1000
+        while len(batch) < LLM_CONFIG.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self) -> None:
+        """Worker loop: dispatch one batch per (model, prefix, stop) group, concurrently."""
+        while True:
+            groups: Dict[tuple, List[_Request]] = defaultdict(list)
+            for request in self._collect():
+                (_, model, prefix, stop), _ = request
+                groups[(model, prefix, stop)].append(request)
+            
+            for key, requests in groups.items():
+                self._pool.submit(self._dispatch, key, requests)
+    
+    @staticmethod
+    def _dispatch(key: tuple, requests: List[_Request]) -> None:
+        """Send one group and resolve each future with its own result or error."""
+        model, prefix, stop = key
+        prompts = [prompt for (prompt, _, _, _), _ in requests]
+        try:
+            responses = hf_llm_generate_batch(
+                prompts, model=model, prefix=prefix, stop=stop, return_exceptions=True
+            )
+        except Exception as e:
+            responses = [e] * len(requests)
+        
+        for (_, future), response in zip(requests, responses):
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+
+BATCHER = PromptBatcher(max_workers=LLM_CONFIG.max_batch_size)
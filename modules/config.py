@@ -2,46 +2,168 @@
 Configuration settings for the Research Assistant Chatbot.
 """
 import os
-from dataclasses import dataclass
-from typing import List
+import re
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
 
+from dotenv import load_dotenv
 
-@dataclass
+# Load .env before any setting below (or in other modules) reads the environment
+load_dotenv()
+
+
+def _env_setting(name: str, default: str, parse: Callable[[str], Any]) -> Any:
+    """A setting read from environment variable name (re-read by reload())."""
+    return field(default_factory=lambda: parse(os.getenv(name, default)), metadata={"env": name})
+
+
+def _is_on(value: str) -> bool:
+    """Parse an on/off environment variable ("1" is on)."""
+    return value == "1"
+
+
+@dataclass(slots=True)
 class LLMConfig:
     """LLM configuration settings."""
     model: str = "meta-llama/Llama-3.2-3B-Instruct"
     max_tokens: int = 512
-    temperature: float = 0.7
+    temperature: float = _env_setting("AGENT_TEMPERATURE", "0.7", float)
+    timeout: float = 30.0
+    batch_window_ms: int = _env_setting("AGENT_BATCH_WINDOW_MS", "0", int)  # 0 disables request coalescing
+    max_batch_size: int = 16
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Agent configuration settings."""
     max_iterations: int = 10
     verbose: bool = True
+    fast_path: bool = _env_setting("AGENT_FAST_PATH", "1", _is_on)
+    jit_json_scanner: bool = _env_setting("AGENT_JIT_JSON_SCAN", "", _is_on)  # needs numba
 
 
-@dataclass  
+@dataclass(slots=True)
+class CacheConfig:
+    """Response cache configuration."""
+    llm_cache_size: int = 1024
+    prompt_cache: bool = _env_setting("AGENT_PROMPT_CACHE", "", _is_on)  # cache sampled calls too
+    semantic_cache: bool = False
+    semantic_threshold: float = 0.92
+    semantic_ttl_seconds: int = 3600
+    translation_cache: bool = False  # reuse translations of near-identical documents
+    translation_threshold: float = 0.98
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+# Terms redacted by the security filter unless configured otherwise
+_DEFAULT_SENSITIVE_TERMS = (
+    "Project Falcon",
+    "Internal-Only",
+    "Confidential",
+    "SECRET",
+    "CLASSIFIED"
+)
+
+
+@dataclass(slots=True)
 class SecurityConfig:
     """Security filter configuration."""
-    sensitive_terms: List[str] = None
+    sensitive_terms: Optional[List[str]] = field(
+        default_factory=lambda: list(_DEFAULT_SENSITIVE_TERMS)
+    )
+    _terms: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _pattern: re.Pattern = field(init=False, repr=False, compare=False)
+    _folded_terms: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _sensitive_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.sensitive_terms is None:
-            self.sensitive_terms = [
-                "Project Falcon",
-                "Internal-Only", 
-                "Confidential",
-                "SECRET",
-                "CLASSIFIED"
-            ]
+        self._compile()
+    
+    def _compile(self) -> None:
+        """Build the matchers below from the current sensitive_terms."""
+        if self.sensitive_terms is None:  # None means the default terms
+            self.sensitive_terms = list(_DEFAULT_SENSITIVE_TERMS)
+        terms = tuple(self.sensitive_terms)
+        # All terms as one case-insensitive alternation (longest first), so
+        # scanning a text is a single regex pass regardless of the term count.
+        # Terms must start a word ("TopSECRET" is left alone), but suffixed
+        # forms such as "SECRETS" or "Confidentiality" are still redacted.
+        alternation = "|".join(
+            re.escape(term)
+            for term in sorted(terms, key=len, reverse=True)
+        )
+        # An empty alternation would match the empty string; (?!) never matches
+        self._pattern = re.compile(
+            rf"(?<!\w)(?:{alternation})" if terms else "(?!)", re.IGNORECASE
+        )
+        # Terms case-folded once, so a query only folds its own text
+        self._folded_terms = tuple(term.casefold() for term in terms)
+        self._sensitive_set = frozenset(self._folded_terms)
+        self._terms = terms
+    
+    def _refresh(self) -> None:
+        """Rebuild the matchers if sensitive_terms was changed or replaced."""
+        if self.sensitive_terms is None or tuple(self.sensitive_terms) != self._terms:
+            self._compile()
+    
+    def contains(self, token: str) -> bool:
+        """Check whether token is itself a sensitive term (case-insensitive)."""
+        self._refresh()
+        return token.casefold() in self._sensitive_set
+    
+    def scan(self, text: str) -> List[str]:
+        """List the sensitive terms that occur in text (case-insensitive)."""
+        self._refresh()
+        # Same matches as redact(), mapped back to the configured terms
+        found = {match.group().casefold() for match in self._pattern.finditer(text)}
+        return [
+            term for term, folded_term in zip(self._terms, self._folded_terms)
+            if folded_term in found
+        ]
+    
+    def contains_sensitive(self, text: str) -> bool:
+        """Check whether text contains any sensitive term."""
+        self._refresh()
+        return self._pattern.search(text) is not None
+    
+    def redact(self, text: str, replacement: str = "[REDACTED]") -> str:
+        """Replace every sensitive term in text."""
+        self._refresh()
+        return self._pattern.sub(replacement, text)
 
 
 # Default configurations
 LLM_CONFIG = LLMConfig()
 AGENT_CONFIG = AgentConfig()
+CACHE_CONFIG = CacheConfig()
 SECURITY_CONFIG = SecurityConfig()
 
+# Run by reload(), for modules holding state derived from the settings
+_reload_callbacks: List[Callable[[], None]] = []
+
+
+def on_reload(callback: Callable[[], None]) -> Callable[[], None]:
+    """Register callback to run after reload(); usable as a decorator."""
+    _reload_callbacks.append(callback)
+    return callback
+
+
+def reload() -> None:
+    """
+    Re-read the environment (and .env) into the environment-backed settings.
+    
+    Other settings keep their current values. The callbacks registered with
+    on_reload then run, so modules can refresh what they derived from the
+    settings or the environment (mock mode, clients, the JSON scanner).
+    """
+    load_dotenv()
+    for config in (LLM_CONFIG, AGENT_CONFIG, CACHE_CONFIG):
+        for setting in fields(config):
+            if "env" in setting.metadata:
+                setattr(config, setting.name, setting.default_factory())
+    for callback in _reload_callbacks:
+        callback()
+
 
 def get_api_key() -> str:
     """Get Hugging Face API key from environment."""
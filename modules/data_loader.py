@@ -1,17 +1,46 @@
 """
 Module for loading data for the Research Assistant Chatbot.
 """
-def load_data():
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Example samples used when no data file is given
+SAMPLE_DATA = (
+    "What is the capital of France?",
+    "Explain the theory of relativity.",
+    "How do you make pancakes?"
+)
+
+
+def iter_data(path=None):
+    """
+    Yields sample text data for LLM processing, one sample at a time.
+    Args:
+        path (str, optional): Text file with one sample per line. Without a
+            path, the built-in example samples are used.
+    Yields:
+        str: Text samples.
+    """
+    logger.info("Loading data...")
+    if path is None:
+        yield from SAMPLE_DATA
+        return
+
+    # Read line by line through a large buffer, so memory stays flat
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line:
+                yield line
+
+
+def load_data(path=None):
     """
     Loads sample text data for LLM processing.
+    Args:
+        path (str, optional): Text file with one sample per line.
     Returns:
         list: List of text samples.
     """
-    print("Loading data...")
-    # Example: Load from a file or database in a real scenario
-    data = [
-        "What is the capital of France?",
-        "Explain the theory of relativity.",
-        "How do you make pancakes?"
-    ]
-    return data
+    return list(iter_data(path))
@@ -1,13 +1,20 @@
 """
 Module for evaluating results for the Research Assistant Chatbot.
 """
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
 def evaluate(results):
     """
     Evaluates and prints model responses.
     Args:
         results (list): List of model responses.
     """
-    print("Evaluating results...")
-    for i, r in enumerate(results, 1):
-        print(f"{i}. {r}")
-    print(f"Total responses: {len(results)}")
+    logger.info("Evaluating results...")
+    # Build the report first and write it in one call instead of one print per line
+    lines = [f"{i}. {r}" for i, r in enumerate(results, 1)]
+    lines.append(f"Total responses: {len(results)}")
+    sys.stdout.write("\n".join(lines) + "\n")
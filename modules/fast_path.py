@@ -0,0 +1,83 @@
+"""
+Fast path for trivial instructions.
+
+Instructions that map onto a fixed tool sequence, such as "Generate a
+company briefing on Tesla" or "Create a briefing about Apple and translate
+to French", are dispatched straight to the tools without an LLM planning
+round. Only companies in COMPANY_DATABASE are handled; anything else returns
+None and falls through to the ReAct loop.
+"""
+import re
+from typing import Callable, Optional
+
+from modules.agent_tools import (
+    COMPANY_DATABASE, get_company_info, generate_document, translate_document,
+    security_filter
+)
+
+
+# Target languages the fast path recognizes; "in detail", "in short" etc.
+# are not languages and fall through to the ReAct loop
+LANGUAGES = (
+    "English", "German", "French", "Spanish", "Italian", "Portuguese", "Dutch",
+    "Polish", "Swedish", "Danish", "Norwegian", "Finnish", "Russian", "Turkish",
+    "Arabic", "Hindi", "Chinese", "Japanese", "Korean"
+)
+
+# "<generate|create> a [company] briefing <on|about|for> X [in L | and translate [it] to L]"
+_BRIEFING_RE = re.compile(
+    r"^\s*(?:generate|create|write|make)\s+(?:a\s+)?(?:company\s+)?briefing\s+"
+    r"(?:on|about|for)\s+(\w+)"
+    r"(?:\s+(?:in|and\s+translate(?:\s+it)?\s+(?:to|into))\s+(" + "|".join(LANGUAGES) + r"))?"
+    r"\s*[.!]?\s*$",
+    re.IGNORECASE
+)
+
+
+def try_fast_path(
+    instruction: str,
+    log: Optional[Callable[[str], None]] = None
+) -> Optional[str]:
+    """
+    Answer an instruction directly if it matches a known simple pattern.
+    
+    Args:
+        instruction: Natural language task description
+        log: Optional callable receiving progress lines
+        
+    Returns:
+        The final document, or None if the instruction needs the agent
+    """
+    match = _BRIEFING_RE.match(instruction)
+    if not match:
+        return None
+    
+    name, language = match.groups()
+    # The database is case-sensitive; resolve the user's casing ("tesla") to
+    # its entry, and leave unknown companies to the agent
+    company = next(
+        (known for known in COMPANY_DATABASE if known.casefold() == name.casefold()),
+        None
+    )
+    if company is None:
+        return None
+    
+    if log:
+        log(f"\nFast path: briefing on {company}" + (f" in {language}" if language else ""))
+        log(f"\nExecuting: get_company_info({company})")
+    info = get_company_info(company)
+    
+    content = {"company_name": info["name"]}
+    content.update((k, v) for k, v in info.items() if k != "name")
+    if log:
+        log("\nExecuting: generate_document(briefing)")
+    document = generate_document("briefing", content)
+    
+    if language and language.lower() != "english":
+        if log:
+            log(f"\nExecuting: translate_document({language.title()})")
+        document = translate_document(document, language.title())
+    
+    if log:
+        log("\nExecuting: security_filter(document)")
+    return security_filter(document)
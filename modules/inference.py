@@ -1,18 +1,59 @@
 """
 Module for running model inference for the Research Assistant Chatbot.
 """
-def run_inference(processed_data):
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Maximum concurrent LLM requests, to stay within HF rate limits
+MAX_CONCURRENT_REQUESTS = 16
+
+
+def run_inference(processed_data, use_llm=False):
     """
     Simulates LLM inference by generating mock responses.
     Args:
-        processed_data (list): List of tokenized samples.
+        processed_data (list): List of (original text, tokens) pairs.
+        use_llm (bool): Query the LLM instead of simulating; samples are
+            sent concurrently (bounded by MAX_CONCURRENT_REQUESTS). Also
+            works when called from a running event loop (e.g. Jupyter),
+            which is blocked until all responses are in.
     Returns:
         list: List of model responses.
     """
-    print("Running inference...")
+    logger.info("Running inference...")
+    if use_llm:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_run_llm(processed_data))
+        # asyncio.run cannot be nested, so use a fresh loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, _run_llm(processed_data)).result()
+
     results = []
-    for tokens in processed_data:
+    for original, _tokens in processed_data:
         # Simulate a response (in reality, call an LLM API)
-        response = f"Response to: {' '.join(tokens)}"
+        response = f"Response to: {original}"
         results.append(response)
     return results
+
+
+async def _run_llm(processed_data):
+    """Generate a response per sample concurrently, in input order."""
+    # Import here so the simulated path does not need huggingface_hub
+    from modules.llm_utils import close_async_client, hf_llm_generate_async
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def generate(prompt):
+        async with semaphore:
+            return await hf_llm_generate_async(prompt)
+
+    try:
+        return await asyncio.gather(*(generate(original) for original, _tokens in processed_data))
+    finally:
+        # The client is bound to this short-lived loop; close its connections
+        await close_async_client()
@@ -0,0 +1,146 @@
+"""
+Exact-match response cache for LLM calls.
+
+Completions are keyed by a BLAKE2b digest of the request (model, prefix,
+stop markers, prompt) so that a prompt seen before in the ReAct loop is
+answered from memory instead of the Inference API. Deterministic calls
+(temperature == 0) are always cached; sampled completions are only cached
+when opted in with AGENT_PROMPT_CACHE=1, since that makes repeats identical.
+
+Synchronous deterministic calls are memoized by hf_llm_generate itself, so
+cached_llm_generate only stores the opted-in sampled completions; the async
+path has no memoization below it and stores both. cache_stats() and
+clear_cache() cover both layers.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from modules.batcher import BATCHER
+from modules.config import LLM_CONFIG, CACHE_CONFIG
+from modules.llm_utils import _cached_generate, hf_llm_generate, hf_llm_generate_async
+
+
+# LRU store of request digest -> completion
+_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_lock = threading.Lock()
+
+# Hit/miss counters of this module's store (see cache_stats for the totals)
+_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _cache_key(model: str, prompt: str, prefix: Optional[str], stop: Tuple[str, ...]) -> bytes:
+    """Build the cache key for a request (hashed field by field, no copy)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, prefix or "", "\x1f".join(stop), prompt):
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+def _generate(prompt: str, model: str, prefix: Optional[str], stop: Tuple[str, ...]) -> str:
+    """Call the LLM, going through the request batcher when it is enabled."""
+    if LLM_CONFIG.batch_window_ms:
+        return BATCHER.submit(prompt, model=model, prefix=prefix, stop=stop)
+    return hf_llm_generate(prompt, model=model, prefix=prefix, stop=stop)
+
+
+async def _generate_async(prompt: str, model: str, prefix: Optional[str], stop: Tuple[str, ...]) -> str:
+    """Async counterpart of _generate."""
+    if LLM_CONFIG.batch_window_ms:
+        return await BATCHER.submit_async(prompt, model=model, prefix=prefix, stop=stop)
+    return await hf_llm_generate_async(prompt, model=model, prefix=prefix, stop=stop)
+
+
+def _cache_enabled() -> bool:
+    """Sampled completions are not reproducible; cache them only on request."""
+    return LLM_CONFIG.temperature == 0 or CACHE_CONFIG.prompt_cache
+
+
+def _lookup(key: bytes) -> Optional[str]:
+    """Return the cached completion for key (marking it recently used), or None."""
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return _cache[key]
+        _stats["misses"] += 1
+    return None
+
+
+def _store(key: bytes, response: str) -> None:
+    """Cache a completion, evicting the least recently used one when full."""
+    with _lock:
+        _cache[key] = response
+        if len(_cache) > CACHE_CONFIG.llm_cache_size:
+            _cache.popitem(last=False)
+
+
+def cached_llm_generate(
+    prompt: str,
+    model: Optional[str] = None,
+    prefix: Optional[str] = None,
+    stop: Tuple[str, ...] = ()
+) -> str:
+    """
+    Generate a completion, serving repeated prompts from the cache.
+    
+    Args:
+        prompt: The input prompt for the LLM
+        model: Model name (defaults to config)
+        prefix: Static prompt prefix (see hf_llm_generate)
+        stop: Stop markers (see hf_llm_generate)
+    
+    Returns:
+        Generated (or cached) text response
+    """
+    model = model if model is not None else LLM_CONFIG.model
+    # temperature == 0 is already memoized inside hf_llm_generate
+    if not _cache_enabled() or LLM_CONFIG.temperature == 0:
+        return _generate(prompt, model, prefix, stop)
+    
+    key = _cache_key(model, prompt, prefix, stop)
+    response = _lookup(key)
+    if response is None:
+        response = _generate(prompt, model, prefix, stop)
+        _store(key, response)
+    return response
+
+
+async def cached_llm_generate_async(
+    prompt: str,
+    model: Optional[str] = None,
+    prefix: Optional[str] = None,
+    stop: Tuple[str, ...] = ()
+) -> str:
+    """
+    Async version of cached_llm_generate, sharing the same cache and
+    request batcher.
+    """
+    model = model if model is not None else LLM_CONFIG.model
+    if not _cache_enabled():
+        return await _generate_async(prompt, model, prefix, stop)
+    
+    key = _cache_key(model, prompt, prefix, stop)
+    response = _lookup(key)
+    if response is None:
+        response = await _generate_async(prompt, model, prefix, stop)
+        _store(key, response)
+    return response
+
+
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss counts across this cache and hf_llm_generate's memoization."""
+    info = _cached_generate.cache_info()
+    with _lock:
+        return {"hits": _stats["hits"] + info.hits, "misses": _stats["misses"] + info.misses}
+
+
+def clear_cache() -> None:
+    """Drop all cached completions (both layers) and reset the counters."""
+    _cached_generate.cache_clear()
+    with _lock:
+        _cache.clear()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
@@ -2,102 +2,379 @@
 LLM utility for agentic workflow.
 Uses Hugging Face Inference API with open-source models.
 """
+import asyncio
 import os
-from typing import Optional
-from huggingface_hub import InferenceClient
+import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 
-from modules.config import LLM_CONFIG, get_api_key
+from modules.config import LLM_CONFIG, get_api_key, on_reload
 
+if TYPE_CHECKING:
+    from huggingface_hub import AsyncInferenceClient, InferenceClient
 
-# Singleton client instance
-_client: Optional[InferenceClient] = None
 
+def _read_use_mock() -> bool:
+    """Whether USE_MOCK_LLM=true is set (for testing without API access)."""
+    return os.getenv("USE_MOCK_LLM", "").lower() == "true"
 
-def get_client() -> InferenceClient:
-    """Get or create the Hugging Face Inference client."""
-    global _client
-    if _client is None:
-        _client = InferenceClient(token=get_api_key())
-    return _client
 
+# Mock mode, read once at import instead of on every call (see reload_env)
+_USE_MOCK = _read_use_mock()
 
-def _mock_llm_response(prompt: str, iteration: int = 0) -> str:
+# Async clients hold a connection pool bound to one event loop, so keep one per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncInferenceClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@cache
+def get_client() -> "InferenceClient":
     """
-    Generate mock LLM responses for testing without API access.
-    Simulates a realistic ReAct agent conversation.
+    Get or create the Hugging Face Inference client (created once, on first use).
+    
+    The client sends requests through huggingface_hub's process-wide HTTP
+    session, so TCP/TLS connections are kept alive across agent iterations.
+    huggingface_hub is imported here, so mock runs never load it.
     """
-    # Detect which iteration we're on based on prompt content
-    if "Observation:" not in prompt:
-        # First iteration - call get_company_info
-        return """I need to get company information first.
+    from huggingface_hub import InferenceClient
+    
+    return InferenceClient(token=get_api_key(), timeout=LLM_CONFIG.timeout)
+
+
+def get_async_client() -> "AsyncInferenceClient":
+    """Get or create the async Hugging Face Inference client for the running event loop."""
+    from huggingface_hub import AsyncInferenceClient
+    
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncInferenceClient(
+            token=get_api_key(), timeout=LLM_CONFIG.timeout
+        )
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running event loop's async client, if one was created."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+@on_reload
+def reload_env() -> None:
+    """
+    Re-read USE_MOCK_LLM and drop the cached clients.
+    
+    Run by config.reload() after changing the environment at runtime (e.g.
+    in tests), so the next request sees the new mock setting and a changed
+    API key.
+    """
+    global _USE_MOCK
+    _USE_MOCK = _read_use_mock()
+    get_client.cache_clear()
+    _async_clients.clear()
+
+
+# Everything the mock inspects in a prompt, found in a single scan
+_MOCK_SCAN_RE = re.compile(r"(Observation:)|(German)|(?i:translate)")
+
+
+def _scan_mock_prompt(prompt: str) -> Tuple[int, bool, bool]:
+    """Return (number of observations, mentions German, mentions translate)."""
+    obs_count = 0
+    has_german = has_translate = False
+    for match in _MOCK_SCAN_RE.finditer(prompt):
+        if match.group(1):
+            obs_count += 1
+        elif match.group(2):
+            has_german = True
+        else:
+            has_translate = True
+    return obs_count, has_german, has_translate
+
+
+_MOCK_LOOKUP = """I need to get company information first.
 Action: get_company_info
 Action Input: Tesla"""
-    
-    elif prompt.count("Observation:") == 1:
-        # Second iteration - we have company info, generate document or finish
-        if "German" in prompt or "translate" in prompt.lower():
-            return """I have the company info. Now I need to generate a briefing and translate it.
+
+_MOCK_GENERATE = """I have the company info. Now I need to generate a briefing and translate it.
 Action: generate_document
 Action Input: {"template": "briefing", "content_dict": {"company_name": "Tesla", "industry": "Electric Vehicles"}}"""
-        else:
-            return """I have gathered the information. Now I will provide the final answer.
-Final Answer: Tesla is an Electric Vehicles & Clean Energy company founded in 2003. The CEO is Elon Musk and the headquarters are in Austin, Texas. Key products include Model S, Model 3, Model X, Model Y, and Cybertruck. The company is a leader in electric vehicle manufacturing and sustainable energy solutions."""
-    
-    elif prompt.count("Observation:") == 2:
-        # Third iteration - translate if needed or finish
-        if "German" in prompt:
-            return """Now I need to translate the document to German.
+
+_MOCK_TRANSLATE = """Now I need to translate the document to German.
 Action: translate_document
 Action Input: {"document": "Tesla Company Briefing...", "target_language": "German"}"""
-        else:
-            return """I have gathered the information. Now I will provide the final answer.
+
+_MOCK_ANSWER_AFTER_LOOKUP = """I have gathered the information. Now I will provide the final answer.
+Final Answer: Tesla is an Electric Vehicles & Clean Energy company founded in 2003. The CEO is Elon Musk and the headquarters are in Austin, Texas. Key products include Model S, Model 3, Model X, Model Y, and Cybertruck. The company is a leader in electric vehicle manufacturing and sustainable energy solutions."""
+
+_MOCK_ANSWER_AFTER_GENERATE = """I have gathered the information. Now I will provide the final answer.
 Final Answer: Tesla is an Electric Vehicles & Clean Energy company founded in 2003. The CEO is Elon Musk and the headquarters are in Austin, Texas. Key products include Model S, Model 3, Model X, Model Y, and Cybertruck."""
-    
-    else:
-        # Final iteration - always finish
-        return """I have gathered the information. Now I will provide the final answer.
+
+_MOCK_ANSWER_FINAL = """I have gathered the information. Now I will provide the final answer.
 Final Answer: Based on the research, Tesla is a leading Electric Vehicles & Clean Energy company founded in 2003 by Elon Musk. Headquartered in Austin, Texas, Tesla produces innovative electric vehicles including the Model S, Model 3, Model X, Model Y, and Cybertruck."""
 
+# Mock response by (iteration stage, translation requested)
+_MOCK_RESPONSES = {
+    # First iteration - call get_company_info
+    (0, False): _MOCK_LOOKUP,
+    (0, True): _MOCK_LOOKUP,
+    # Second iteration - we have company info, generate document or finish
+    (1, True): _MOCK_GENERATE,
+    (1, False): _MOCK_ANSWER_AFTER_LOOKUP,
+    # Third iteration - translate if needed or finish
+    (2, True): _MOCK_TRANSLATE,
+    (2, False): _MOCK_ANSWER_AFTER_GENERATE,
+    # Final iteration - always finish
+    (3, False): _MOCK_ANSWER_FINAL,
+    (3, True): _MOCK_ANSWER_FINAL,
+}
+
+
+def _mock_llm_response(prompt: str, iteration: int = 0) -> str:
+    """
+    Generate mock LLM responses for testing without API access.
+    Simulates a realistic ReAct agent conversation.
+    """
+    # Detect which iteration we're on based on prompt content
+    obs_count, has_german, has_translate = _scan_mock_prompt(prompt)
+    stage = min(obs_count, 3)
+    
+    # Any translation request triggers a briefing; only German gets translated
+    wants_translation = (has_german or has_translate) if stage == 1 else has_german
+    return _MOCK_RESPONSES[stage, wants_translation]
+
+
+class _StopScanner:
+    """
+    Accumulate streamed completion text and detect the first stop marker.
+    
+    Only the newly received text plus a short overlap is searched for the
+    markers, so the scan stays linear in the response length.
+    """
+    
+    def __init__(self, stop: Sequence[str]):
+        self.stop = stop
+        self.parts: List[str] = []
+        self.received = 0
+        self.overlap = max((len(marker) for marker in stop), default=1) - 1
+        self.tail = ""
+        self.cut: Optional[int] = None
+    
+    def feed(self, chunk) -> bool:
+        """Add a stream chunk; returns True once a stop marker has been seen."""
+        if not chunk.choices:
+            return False
+        delta = chunk.choices[0].delta.content or ""
+        self.parts.append(delta)
+        self.received += len(delta)
+        
+        if self.stop:
+            window = self.tail + delta
+            hits = [pos for pos in (window.find(marker) for marker in self.stop) if pos != -1]
+            if hits:
+                self.cut = self.received - len(window) + min(hits)
+                return True
+            self.tail = window[-self.overlap:] if self.overlap else ""
+        return False
+    
+    def text(self) -> str:
+        """The text received so far, cut just before the stop marker if one was seen."""
+        text = "".join(self.parts)
+        return text if self.cut is None else text[:self.cut]
+
+
+def _read_stream(stream, stop: Sequence[str]) -> str:
+    """Collect streamed completion chunks, stopping at the first stop marker."""
+    scanner = _StopScanner(stop)
+    for chunk in stream:
+        if scanner.feed(chunk):
+            break
+    return scanner.text()
+
+
+async def _read_stream_async(stream, stop: Sequence[str]) -> str:
+    """Async counterpart of _read_stream."""
+    scanner = _StopScanner(stop)
+    async for chunk in stream:
+        if scanner.feed(chunk):
+            break
+    return scanner.text()
+
+
+def _build_messages(prompt: str, prefix: Optional[str]) -> List[Dict[str, str]]:
+    """Chat messages for a prompt, with the static prefix as a system message."""
+    messages = [{"role": "user", "content": prompt}]
+    if prefix:
+        messages.insert(0, {"role": "system", "content": prefix})
+    return messages
+
+
+def _generate(
+    prompt: str,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    prefix: Optional[str],
+    stop: Sequence[str]
+) -> str:
+    """Stream one chat completion from the Inference API."""
+    client = get_client()
+    try:
+        stream = client.chat.completions.create(
+            model=model,
+            messages=_build_messages(prompt, prefix),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop=list(stop) or None,
+            stream=True
+        )
+        return _read_stream(stream, stop)
+    except Exception as e:
+        raise RuntimeError(f"LLM generation failed: {e}") from e
+
+
+@lru_cache(maxsize=1024)
+def _cached_generate(
+    prompt: str,
+    model: str,
+    max_tokens: int,
+    prefix: Optional[str],
+    stop: Tuple[str, ...]
+) -> str:
+    """Memoized greedy (temperature 0) completion; clear with _cached_generate.cache_clear()."""
+    return _generate(prompt, model, max_tokens, 0, prefix, stop)
+
 
 def hf_llm_generate(
     prompt: str,
     model: Optional[str] = None,
     max_tokens: Optional[int] = None,
-    temperature: Optional[float] = None
+    temperature: Optional[float] = None,
+    prefix: Optional[str] = None,
+    stop: Sequence[str] = ()
 ) -> str:
     """
     Call Hugging Face Inference API for chat-based LLM generation.
     
+    Stop markers are sent to the server so the model halts generation there.
+    The completion is also streamed and scanned, so providers that ignore
+    `stop` are cut off client-side by abandoning the stream.
+    
+    With temperature 0 the completion is deterministic, so repeated
+    requests are answered from an in-process LRU cache.
+    
     Args:
         prompt: The input prompt for the LLM
         model: Model name (defaults to config)
         max_tokens: Maximum tokens to generate (defaults to config)
         temperature: Sampling temperature (defaults to config)
+        prefix: Static prompt prefix, sent as a separate system message ahead
+            of the prompt. Keeping it byte-identical across calls lets the
+            provider's prefix (KV) cache skip re-prefilling it.
+        stop: Markers that end the completion early; the returned text is
+            cut just before the first one
     
     Returns:
         Generated text response
     
     Raises:
         ValueError: If API key is not set
-        Exception: If API call fails
+        RuntimeError: If API call fails (the original error is chained as __cause__)
     """
     # Check for mock mode (for testing without API)
-    if os.getenv("USE_MOCK_LLM", "").lower() == "true":
-        return _mock_llm_response(prompt)
+    if _USE_MOCK:
+        return _mock_llm_response((prefix or "") + prompt)
     
-    client = get_client()
+    model = model if model is not None else LLM_CONFIG.model
+    max_tokens = max_tokens if max_tokens is not None else LLM_CONFIG.max_tokens
+    temperature = temperature if temperature is not None else LLM_CONFIG.temperature
+    
+    if temperature == 0:
+        return _cached_generate(prompt, model, max_tokens, prefix, tuple(stop))
+    return _generate(prompt, model, max_tokens, temperature, prefix, stop)
+
+
+async def hf_llm_generate_async(
+    prompt: str,
+    model: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+    prefix: Optional[str] = None,
+    stop: Sequence[str] = ()
+) -> str:
+    """
+    Non-blocking version of hf_llm_generate.
+    
+    Streams the completion through AsyncInferenceClient, so other coroutines
+    (e.g. concurrent tool calls or other users' requests) keep running while
+    the model is decoding. Arguments and return value as in hf_llm_generate.
+    """
+    # Check for mock mode (for testing without API)
+    if _USE_MOCK:
+        return _mock_llm_response((prefix or "") + prompt)
+    
+    client = get_async_client()
     
-    model = model or LLM_CONFIG.model
-    max_tokens = max_tokens or LLM_CONFIG.max_tokens
-    temperature = temperature or LLM_CONFIG.temperature
+    model = model if model is not None else LLM_CONFIG.model
+    max_tokens = max_tokens if max_tokens is not None else LLM_CONFIG.max_tokens
+    temperature = temperature if temperature is not None else LLM_CONFIG.temperature
     
     try:
-        completion = client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model=model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=_build_messages(prompt, prefix),
             max_tokens=max_tokens,
-            temperature=temperature
+            temperature=temperature,
+            stop=list(stop) or None,
+            stream=True
         )
-        return completion.choices[0].message.content
+        return await _read_stream_async(stream, stop)
     except Exception as e:
-        raise Exception(f"LLM generation failed: {e}")
+        raise RuntimeError(f"LLM generation failed: {e}") from e
+
+
+def hf_llm_generate_batch(
+    prompts: List[str],
+    model: Optional[str] = None,
+    prefix: Optional[str] = None,
+    stop: Sequence[str] = (),
+    return_exceptions: bool = False
+) -> List[Union[str, Exception]]:
+    """
+    Generate completions for several prompts in one call.
+    
+    The chat completions API takes a single conversation per request, so
+    identical prompts are collapsed into one request and the remaining ones
+    are sent concurrently over the shared client.
+    
+    Args:
+        prompts: Input prompts
+        model: Model name (defaults to config)
+        prefix: Static prompt prefix shared by all prompts
+        stop: Stop markers shared by all prompts
+        return_exceptions: Return a failed prompt's exception in its slot
+            instead of raising, so one bad prompt does not fail the others
+    
+    Returns:
+        Generated text responses (or exceptions), in the same order as the prompts
+    """
+    def generate(prompt: str) -> Union[str, Exception]:
+        try:
+            return hf_llm_generate(prompt, model=model, prefix=prefix, stop=stop)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return e
+    
+    unique = list(dict.fromkeys(prompts))
+    if len(unique) == 1:
+        responses = {unique[0]: generate(unique[0])}
+    else:
+        with ThreadPoolExecutor(max_workers=len(unique)) as pool:
+            responses: Dict[str, Union[str, Exception]] = dict(zip(unique, pool.map(generate, unique)))
+    return [responses[p] for p in prompts]
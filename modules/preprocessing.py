@@ -1,21 +1,30 @@
 """
 Module for preprocessing data for the Research Assistant Chatbot.
 """
+import logging
 import re
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Anything that is not a word character or whitespace
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
 
 def preprocess(data):
     """
     Cleans and tokenizes text data.
     Args:
-        data (list): List of text samples.
+        data (iterable): Text samples, e.g. a list or data_loader.iter_data().
     Returns:
-        list: List of tokenized samples.
+        list: List of (original text, tokens) pairs, so later stages can
+            use the raw text without re-joining the tokens.
     """
-    print("Preprocessing data...")
-    processed = []
-    for d in data:
-        # Lowercase, remove punctuation, split into tokens
-        clean = re.sub(r'[^\w\s]', '', d.lower())
-        tokens = clean.split()
-        processed.append(tokens)
-    return processed
+    logger.info("Preprocessing data...")
+    return [(d, list(_tokenize(d))) for d in data]
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text):
+    """Lowercase, remove punctuation, split into tokens (cached per text)."""
+    return tuple(_PUNCT_RE.sub('', text.lower()).split())
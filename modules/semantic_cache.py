@@ -0,0 +1,151 @@
+"""
+Semantic caches for agent answers and translations.
+
+Instructions are embedded with a sentence-transformers model and compared
+by cosine similarity, so a paraphrase of an instruction that was already
+answered ("Generate a briefing on Tesla" vs. "Create a Tesla briefing")
+returns the stored answer without running the ReAct loop again. Answers are
+bucketed by the names an instruction mentions (company, language), and
+translations by target language, where the same mechanism reuses
+translations of documents that differ only in minor formatting.
+"""
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from modules.config import CACHE_CONFIG
+
+# numpy comes with sentence-transformers and is imported on first use, so
+# startup does not pay for it while the caches are disabled
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Embedding model, loaded on first use
+_embedder = None
+
+
+def _get_embedder():
+    """Get or load the sentence-transformers embedding model."""
+    global _embedder
+    if _embedder is None:
+        from sentence_transformers import SentenceTransformer
+        _embedder = SentenceTransformer(CACHE_CONFIG.embedding_model)
+    return _embedder
+
+
+@lru_cache(maxsize=256)
+def embed(text: str) -> "np.ndarray":
+    """Embed text as an L2-normalized vector (dot product == cosine)."""
+    return _get_embedder().encode(text, normalize_embeddings=True)
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache of text -> value.
+    
+    Vectors are kept in a stacked matrix so a lookup is a single
+    matrix-vector product. Entries older than the TTL are evicted lazily
+    on lookup.
+    """
+    
+    def __init__(self, threshold: float, ttl_seconds: float):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._matrix: Optional["np.ndarray"] = None
+        self._values: List[str] = []
+        self._created_at: List[float] = []
+        self._lock = threading.Lock()
+    
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL (entries are in insertion order)."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = 0
+        while expired < len(self._created_at) and self._created_at[expired] < cutoff:
+            expired += 1
+        if expired:
+            self._matrix = self._matrix[expired:] if expired < len(self._values) else None
+            del self._values[:expired]
+            del self._created_at[:expired]
+    
+    def lookup(self, text: str) -> Optional[str]:
+        """Return the value stored for the most similar text, if close enough."""
+        import numpy as np
+        
+        vector = embed(text)
+        with self._lock:
+            self._evict_expired()
+            if self._matrix is None:
+                return None
+            scores = self._matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] > self.threshold:
+                return self._values[best]
+        return None
+    
+    def store(self, text: str, value: str) -> None:
+        """Add a text/value pair to the cache."""
+        import numpy as np
+        
+        vector = embed(text)[np.newaxis, :]
+        with self._lock:
+            self._matrix = vector if self._matrix is None else np.vstack([self._matrix, vector])
+            self._values.append(value)
+            self._created_at.append(time.time())
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._matrix = None
+            self._values.clear()
+            self._created_at.clear()
+
+
+class BucketedSemanticCache:
+    """
+    A SemanticCache per bucket key (e.g. target language).
+    
+    Texts are only compared against entries in the same bucket, so a lookup
+    never returns a value stored under a different key.
+    """
+    
+    def __init__(self, threshold: float, ttl_seconds: float):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._buckets: Dict[str, SemanticCache] = {}
+        self._lock = threading.Lock()
+    
+    def _bucket(self, key: str) -> SemanticCache:
+        """Get or create the cache for a bucket key."""
+        with self._lock:
+            cache = self._buckets.get(key)
+            if cache is None:
+                cache = self._buckets[key] = SemanticCache(self.threshold, self.ttl_seconds)
+            return cache
+    
+    def lookup(self, key: str, text: str) -> Optional[str]:
+        """Return the value stored for the most similar text in the bucket, if close enough."""
+        return self._bucket(key).lookup(text)
+    
+    def store(self, key: str, text: str, value: str) -> None:
+        """Add a text/value pair to the bucket."""
+        self._bucket(key).store(text, value)
+    
+    def clear(self) -> None:
+        """Remove all buckets."""
+        with self._lock:
+            self._buckets.clear()
+
+
+# Cache of final agent answers keyed by the names mentioned and the instruction
+ANSWER_CACHE = BucketedSemanticCache(
+    threshold=CACHE_CONFIG.semantic_threshold,
+    ttl_seconds=CACHE_CONFIG.semantic_ttl_seconds
+)
+
+# Cache of translations keyed by target language and source document
+TRANSLATION_CACHE = BucketedSemanticCache(
+    threshold=CACHE_CONFIG.translation_threshold,
+    ttl_seconds=CACHE_CONFIG.semantic_ttl_seconds
+)